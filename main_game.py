@@ -7,12 +7,67 @@ import itertools
 import numpy as np
 import numpy.typing as npt
 from typing import List, Tuple, Iterable, Optional, Union
+try:
+    import numba
+except ImportError:
+    numba = None
 
 _all_numpy_int_types = Union[np.int8, np.int16, np.int32, np.int64]
 
 X = 1
 O = 2
 
+#directions only depend on the number of dimensions, so share them between boards
+_DIR_CACHE = {2: ((1, -1), (1, 0), (1, 1), (0, 1))}
+#one table of random keys per board shape, shared so equal positions hash equally
+_ZOBRIST_CACHE = {}
+
+
+def _zobrist_table_for(dimensions: Tuple[int, ...]) -> npt.NDArray[np.uint64]:
+    """
+    Get the Zobrist key table for a board shape, one uint64 per (cell, player).
+    :param dimensions: The dimensions of the board.
+    :return: A (cells, 2) array of random keys.
+    """
+    if dimensions not in _ZOBRIST_CACHE:
+        rng = np.random.default_rng(0)
+        cells = int(np.prod(dimensions))
+        _ZOBRIST_CACHE[dimensions] = rng.integers(0, 2 ** 64, size=(cells, 2), dtype=np.uint64)
+    return _ZOBRIST_CACHE[dimensions]
+
+
+def _check_win_from(board_np: npt.NDArray[np.int8], row: int, col: int,
+                    in_a_row: int, directions_np: npt.NDArray[np.int8]) -> int:
+    """
+    Walk the rays through a cell counting consecutive equal marks.
+    :param board_np: The 2D board state.
+    :param row: The row of the cell to check from.
+    :param col: The column of the cell to check from.
+    :param in_a_row: How many marks in a row are needed to win.
+    :param directions_np: The directions to check, as a (D, 2) array.
+    :return: The mark at the cell if it completes a line, 0 otherwise.
+    """
+    player = board_np[row, col]
+    n_rows, n_cols = board_np.shape
+    for direction in range(directions_np.shape[0]):
+        d_row = directions_np[direction, 0]
+        d_col = directions_np[direction, 1]
+        count = 1
+        for sign in (1, -1):
+            r = row + sign * d_row
+            c = col + sign * d_col
+            while 0 <= r < n_rows and 0 <= c < n_cols and board_np[r, c] == player:
+                count += 1
+                r += sign * d_row
+                c += sign * d_col
+        if count >= in_a_row:
+            return int(player)
+    return 0
+
+
+if numba is not None:
+    _check_win_from = numba.njit(cache=True)(_check_win_from)
+
 #--------------------------------------------------------------------------------------------------------
 class Board:
     #preparation :
@@ -26,12 +81,73 @@ class Board:
         self.dimensions = tuple(dimensions)
         self.x_in_a_row = x_in_a_row
         self.board = self.create_board()
-        self._directions = self.find_directions()
+        self._init_caches()
         self.move_count = 0
-        self.moves: List[Move] = []
+        self.moves: List[Tuple[int, ...]] = []
         self.x: List[Move] = []
         self.o: List[Move] = []
         self.turn = X
+        self._winner: Optional[int] = None
+
+    def _init_caches(self) -> None:
+        """
+        Set up the direction tables and the bitboard layout for the current dimensions.
+        """
+        self._directions = self.find_directions()
+        self._directions_np = np.asarray(self._directions, dtype=np.int8) if len(self.dimensions) == 2 else None
+        #? small 2D boards also keep one bitmask per player, padded by one column so lines cannot wrap across rows
+        self._use_bitboard = len(self.dimensions) == 2 and int(np.prod(self.dimensions)) <= 64
+        self._bit_stride = self.dimensions[1] + 1 if self._use_bitboard else 0
+        self.x_bits = 0
+        self.o_bits = 0
+        self._zobrist_table = _zobrist_table_for(self.dimensions)
+        self.zhash = 0
+        #bound once so the ray walk pays a scalar check instead of NumPy dispatch on 2D boards
+        self.out_of_bounds = self._out_of_bounds_2d if len(self.dimensions) == 2 else self._out_of_bounds_nd
+
+    @classmethod
+    def _from_state(cls, dimensions: Tuple[int, ...], x_in_a_row: int,
+                    board: npt.NDArray[np.int8], turn: int) -> "Board":
+        """
+        Build a board around an existing state array, skipping `create_board`.
+        :param dimensions: The dimensions of the board.
+        :param x_in_a_row: How many marks in a row are needed to win.
+        :param board: The state array to take ownership of.
+        :param turn: The player to move.
+        :return: A board wrapping the given state.
+        """
+        obj = cls.__new__(cls)
+        obj.dimensions = dimensions
+        obj.x_in_a_row = x_in_a_row
+        obj.board = board
+        obj._init_caches()
+        obj.move_count = int(np.count_nonzero(board))
+        obj.moves = []
+        obj.x = []
+        obj.o = []
+        obj.turn = turn
+        for cell in zip(*np.nonzero(board)):
+            player = int(board[cell])
+            obj.zhash ^= int(obj._zobrist_table[obj._flat_index(cell), player - 1])
+            if obj._use_bitboard:
+                bit = 1 << (int(cell[0]) * obj._bit_stride + int(cell[1]))
+                if player == X:
+                    obj.x_bits |= bit
+                else:
+                    obj.o_bits |= bit
+        obj._winner = obj._scan_winner()
+        return obj
+
+    def _flat_index(self, coordinates: Iterable[int]) -> int:
+        """
+        Get the flat index of a position in row-major order.
+        :param coordinates: The position to convert.
+        :return: The flat index of the position.
+        """
+        flat = 0
+        for coordinate, size in zip(coordinates, self.dimensions):
+            flat = flat * size + int(coordinate)
+        return flat
     #board creation (called automatically)
     def create_board(self) -> npt.NDArray[np.int8]:
         """
@@ -45,10 +161,7 @@ class Board:
         Get a copy of the board.
         :return: A copy of the board.
         """
-        board = Board(self.dimensions, self.x_in_a_row)
-        board.turn = self.turn
-        board.board = self.board.copy()
-        return board
+        return Board._from_state(self.dimensions, self.x_in_a_row, self.board.copy(), self.turn)
     #function return the mark at a given position :
     def get_mark_at_position(self, position: Iterable[int]) -> int:
         """
@@ -56,7 +169,14 @@ class Board:
         :param position: The position to check.
         :return: The player that has a mark at the position.
         """
-        position = tuple(position)
+        return self._get_mark_at_position_t(tuple(position))
+
+    def _get_mark_at_position_t(self, position: Tuple[int, ...]) -> int:
+        """
+        Get the mark at a position that is already a tuple.
+        :param position: The position to check.
+        :return: The player that has a mark at the position.
+        """
         return int(self.board[position])
     #set a move (mark) in the board and update it with no condition :
     def set_mark(self, coordinates: Iterable[int], player: int) -> None:
@@ -65,7 +185,24 @@ class Board:
         :param coordinates: The position to add a mark at.
         :param player: The player that put the mark at the position.
         """
-        self.board[tuple(coordinates)] = player
+        self._place_mark(tuple(coordinates), player)
+        if self._winner is None:
+            self._winner = self._scan_winner()
+
+    def _place_mark(self, coordinates: Tuple[int, ...], player: int) -> None:
+        """
+        Write a mark on the board without refreshing the cached winner.
+        :param coordinates: The position to add a mark at.
+        :param player: The player that put the mark at the position.
+        """
+        self.board[coordinates] = player
+        self.zhash ^= int(self._zobrist_table[self._flat_index(coordinates), player - 1])
+        if self._use_bitboard:
+            bit = 1 << (coordinates[0] * self._bit_stride + coordinates[1])
+            if player == X:
+                self.x_bits |= bit
+            else:
+                self.o_bits |= bit
         if player == X:
             self.x.append(Move(coordinates))
         else:
@@ -77,7 +214,18 @@ class Board:
         :param position: The position to check.
         :return: If the position is empty.
         """
-        return self.get_mark_at_position(position) == 0
+        return self._is_empty_t(tuple(position))
+
+    def _is_empty_t(self, position: Tuple[int, ...]) -> bool:
+        """
+        Get if a position that is already a tuple is empty.
+        :param position: The position to check.
+        :return: If the position is empty.
+        """
+        if self._use_bitboard:
+            row, col = position
+            return not ((self.x_bits | self.o_bits) >> (row * self._bit_stride + col)) & 1
+        return self._get_mark_at_position_t(position) == 0
     #make a move in the board (more efficient) :
     def push(self, coordinates: Iterable[int]) -> None:
         """
@@ -85,44 +233,152 @@ class Board:
         :param coordinates: The position to add a mark at.
         """
         coordinates = tuple(coordinates)
-        if not self.is_empty(coordinates):
+        if not self._is_empty_t(coordinates):
             raise ValueError("Position is not empty.")
-        move = Move(coordinates)
-        self.set_mark(coordinates, self.turn)
+        self._place_mark(coordinates, self.turn)
+        #no line can exist before the mover's x_in_a_row-th mark, i.e. move 2 * x_in_a_row - 1
+        if self.move_count + 1 >= 2 * self.x_in_a_row - 1:
+            self._update_winner(coordinates, self.turn)
         self.turn = X if self.turn == O else O
-        self.moves.append(move)
+        self.moves.append(coordinates)
         self.move_count += 1
 
-    def find_directions(self) -> List[Tuple[int, ...]]:
+    def _update_winner(self, coordinates: Tuple[int, ...], player: int) -> None:
+        """
+        Check only the rays through the last move for a win and cache it.
+        :param coordinates: The position of the last move.
+        :param player: The player that made the last move.
+        """
+        if self._winner is not None:
+            #the game is already decided, the first winner stands
+            return
+        if self._use_bitboard:
+            if self._bitboard_won(self.x_bits if player == X else self.o_bits):
+                self._winner = player
+            return
+        if self._directions_np is not None:
+            winner = _check_win_from(self.board, coordinates[0], coordinates[1], self.x_in_a_row, self._directions_np)
+            if winner:
+                self._winner = winner
+            return
+        for direction in self._directions:
+            in_a_row = 1
+            for sign in (1, -1):
+                pos = coordinates
+                while True:
+                    pos = tuple(coordinate + sign * step for coordinate, step in zip(pos, direction))
+                    if self.out_of_bounds(pos) or self.board[pos] != player:
+                        break
+                    in_a_row += 1
+            if in_a_row >= self.x_in_a_row:
+                self._winner = player
+                return
+
+    def _bitboard_won(self, bits: int) -> bool:
+        """
+        Get if a player bitmask contains `x_in_a_row` marks in a row.
+        :param bits: The bitmask of the player to check.
+        :return: If the mask contains a completed line.
+        """
+        #shift amounts for horizontal, anti-diagonal, vertical and diagonal lines
+        stride = self._bit_stride
+        for shift in (1, stride - 1, stride, stride + 1):
+            folded = bits
+            for _ in range(self.x_in_a_row - 1):
+                folded &= folded >> shift
+            if folded:
+                return True
+        return False
+
+    def _scan_winner(self) -> Optional[int]:
+        """
+        Scan the whole board for a winner with vectorized slice comparisons.
+        :return: The winning player, if any.
+        """
+        for player in (X, O):
+            if self._player_has_line(player):
+                return player
+        return None
+
+    def _player_has_line(self, player: int) -> bool:
+        """
+        Get if a player has `x_in_a_row` marks in a row anywhere on the board.
+        :param player: The player to check.
+        :return: If the player has a completed line.
+        """
+        mask = self.board == player
+        in_a_row = self.x_in_a_row
+        for direction in self._directions:
+            #valid starting positions along each axis, so the whole line stays on the board
+            bounds = [(max(0, -(in_a_row - 1) * d), size - max(0, (in_a_row - 1) * d))
+                      for size, d in zip(self.dimensions, direction)]
+            if any(low >= high for low, high in bounds):
+                continue
+            #AND together x_in_a_row views of the mask, each shifted one step along the direction
+            views = []
+            for step in range(in_a_row):
+                index = tuple(slice(low + step * d, high + step * d)
+                              for (low, high), d in zip(bounds, direction))
+                views.append(mask[index])
+            if np.logical_and.reduce(views).any():
+                return True
+        return False
+
+    def find_directions(self) -> Tuple[Tuple[int, ...], ...]:
         """
         Get directions to be used when checking for a win.
         :return: The directions to check for a win.
         """
-        directions = list(itertools.product([1, 0, -1], repeat=len(self.dimensions)))
-        correct_directions = []
-        for direction in directions:
-            for item in direction:
-                if item > 0:
-                    correct_directions.append(direction)
-                    break
-                elif item < 0:
-                    break
-        return correct_directions
+        ndim = len(self.dimensions)
+        if ndim not in _DIR_CACHE:
+            directions = list(itertools.product([1, 0, -1], repeat=ndim))
+            correct_directions = []
+            for direction in directions:
+                for item in direction:
+                    if item > 0:
+                        correct_directions.append(direction)
+                        break
+                    elif item < 0:
+                        break
+            _DIR_CACHE[ndim] = tuple(correct_directions)
+        return _DIR_CACHE[ndim]
     #return all the possible moves in the board :
     def possible_moves(self) -> npt.NDArray[np.int64]:
         """
         Get all possible moves.
-        :return: All the positions where there is no mark.
+        :return: The flat indices of all the positions where there is no mark.
         """
-        return np.argwhere(self.board == 0)
+        return np.flatnonzero(self.board.ravel() == 0)
 
-    def out_of_bounds(self, pos: npt.NDArray[_all_numpy_int_types]) -> np.bool_:
+    def possible_move_coords(self) -> Iterable[Tuple[int, ...]]:
+        """
+        Get all possible moves as coordinate tuples, one at a time.
+        :return: A generator over the positions where there is no mark.
+        """
+        if len(self.dimensions) == 2:
+            cols = self.dimensions[1]
+            for index in self.possible_moves():
+                yield divmod(int(index), cols)
+        else:
+            for index in self.possible_moves():
+                yield tuple(int(coordinate) for coordinate in np.unravel_index(index, self.dimensions))
+
+    def _out_of_bounds_2d(self, pos: Iterable[int]) -> bool:
+        """
+        Get if a position is out of a 2D board, with scalar comparisons only.
+        :param pos: The position to check.
+        :return: If the position is out of the board.
+        """
+        return pos[0] < 0 or pos[1] < 0 or pos[0] >= self.dimensions[0] or pos[1] >= self.dimensions[1]
+
+    def _out_of_bounds_nd(self, pos: npt.NDArray[_all_numpy_int_types]) -> bool:
         """
         Get if a position is out of the board.
         :param pos: The position to check.
         :return: If the position is out of the board.
         """
-        return (pos < 0).any() or (pos >= self.dimensions).any()
+        pos = np.asarray(pos)
+        return bool((pos < 0).any() or (pos >= self.dimensions).any())
 
     def in_bounds(self, pos: npt.NDArray[_all_numpy_int_types]) -> bool:
         """
@@ -138,31 +394,16 @@ class Board:
         :param player: The player to check.
         :return: If the player has won.
         """
-        positions = np.argwhere(self.board == player)
-        for position in positions:
-            for direction in self._directions:
-                for in_a_row in range(1, self.x_in_a_row):
-                    pos = position + np.multiply(direction, in_a_row)
-                    if self.out_of_bounds(pos) or self.board[tuple(pos)] != player:
-                        break
-                else:
-                    return True
-        return False
+        return self._winner == player
 
     def result(self) -> Optional[int]:
         """
         Get the result of the game.
         :return: The result of the board.
         """
-        x_won = self.has_won(X)
-        o_won = self.has_won(O)
-        if x_won and o_won:
-            raise Exception(f"Both X and O have {self.x_in_a_row} pieces in a row.")
-        elif x_won:
-            return X
-        elif o_won:
-            return O
-        elif self.board.all():
+        if self._winner is not None:
+            return self._winner
+        elif self.move_count == np.prod(self.dimensions):
             return 0
         return None
 
@@ -205,11 +446,19 @@ class Move:
         """
         assert coordinate_move or str_move
         self.coordinate_move = coordinate_move
-        self.str_move = str_move
-        if self.coordinate_move:
-            self.str_move = "-".join(map(str, tuple(self.coordinate_move)))
-        elif self.str_move:
-            self.coordinate_move = tuple(map(int, self.str_move.split("-")))
+        self._str_move = str_move
+        if not self.coordinate_move:
+            self.coordinate_move = tuple(map(int, self._str_move.split("-")))
+
+    @property
+    def str_move(self) -> str:
+        """
+        Get the move in a human-readable format, built on first access.
+        :return: The move as a string.
+        """
+        if self._str_move is None:
+            self._str_move = "-".join(map(str, tuple(self.coordinate_move)))
+        return self._str_move
 #---------------------------------------------------------------------------------------------------------------------------------
 pygame.init()
 pygame.mixer.init()
@@ -231,19 +480,21 @@ author2 = font.render("developped by B.Beligh",True,(0,0,0))
 length, height = 712, 712
 window = pygame.display.set_mode((length, height))
 board = None
+game_status = None
 
 lines, cols, chain = 3, 3, 3
 ##################################################################################
 #? this function will assigned the params given in the widgets to the actual board
 def get_size() :
     loop = False
-    global lines, cols, chain, board, board_squares
+    global lines, cols, chain, board, board_squares, square_hit, game_status
     try :
         lines = int(lines_widget.getText())
         cols = int(columns_widget.getText())
         chain = int(chain_widget.getText())
         board = Board((lines,cols),chain)
-        board_squares = make_board(cols,lines)
+        board_squares, square_hit = make_board(lines,cols)
+        game_status = None
     except Exception :
         print("error, one or all the parametres is(are) wrong!!")
         loop = True
@@ -275,96 +526,128 @@ columns_widget.fontSize = 3
 lines_widget.setText("3")
 columns_widget.setText("3")
 chain_widget.setText("3")
+#? the labels never move, so compose them into a single overlay blitted once per frame
+static_overlay = pygame.Surface((length, height), pygame.SRCALPHA)
+static_overlay.blit(text_lines, (lines_widget.getX()-text_lines.get_width()/4, lines_widget.getY()+lines_widget.getHeight()))
+static_overlay.blit(text_cols, (columns_widget.getX()-text_cols.get_width()/4, columns_widget.getY()+columns_widget.getHeight()))
+static_overlay.blit(text_chain, (chain_widget.getX()-text_chain.get_width()/4, chain_widget.getY()+chain_widget.getHeight()))
+static_overlay.blit(author1,(356-author1.get_width()/2, 556))
+static_overlay.blit(author2,(356-author2.get_width()/2, 556+author2.get_height()))
+
+#? the X and O shapes are rasterized once per square size (and color for the O hole) and then just blitted
+_glyph_cache = {}
+def _get_glyphs(width, height, color):
+    """ pre-render the X and O surfaces for a square of the given size and color """
+    key = (width, height, color)
+    if key not in _glyph_cache :
+        cst = 1/15
+        hmarg = width/10
+        vmarg = height/10
+        length = width/8
+        x_surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.polygon(x_surf, (120,120,120),[(hmarg, vmarg),
+                                                   (hmarg+length, vmarg),
+                                                   (width/2, height/2-height*cst),
+                                                   (width-hmarg-length, vmarg),
+                                                   (width-hmarg, vmarg),
+                                                   (width/2+width*cst, height/2),
+                                                   (width-hmarg, height-vmarg),
+                                                   (width-hmarg-length, height-vmarg),
+                                                   (width/2, height/2+height*cst),
+                                                   (hmarg+length, height-vmarg),
+                                                   (hmarg, height-vmarg),
+                                                   (width/2-width*cst, height/2)])
+        o_surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.ellipse(o_surf, (120,120,120), pygame.Rect(width/10, height/10, width*8/10, height*8/10))
+        pygame.draw.ellipse(o_surf, color, pygame.Rect(width/5, height/5, width*3/5, height*3/5))
+        _glyph_cache[key] = (x_surf, o_surf)
+    return _glyph_cache[key]
 
 class square :
     def __init__(self, position: tuple, board_size:tuple, window) :
-        """ position in the position of the square in the board : like it's line and row references
-            board_size is the number of lines and rows in the board whiche the square is placed
+        """ position is the (line, col) of the square, matching the board indexing
+            board_size is the number of (lines, cols) in the board whiche the square is placed
         """
         self.position = position
         self.size = [0, 0]
-        self.size[0] = 712/board_size[0]
-        self.size[1] = 712/board_size[1]
+        self.size[0] = 712/board_size[1]
+        self.size[1] = 712/board_size[0]
         self.width = self.size[0]
         self.height = self.size[1]
-        self.x = self.position[0]*self.width
-        self.y = self.position[1]*self.height
+        self.x = self.position[1]*self.width
+        self.y = self.position[0]*self.height
         self.center = (self.x+self.width/2, self.y+self.height/2)
         self.window = window
         self.hover = self.X = self.O = False
+        self._last_state = None
         if ((position[0]+position[1]) % 2) == 0 :
             self.set_color((121, 102, 244))
         else :
             self.set_color((208, 208, 208))
+        self._x_surf, self._o_surf = _get_glyphs(self.width, self.height, self.color)
 
     def set_color (self, color:tuple):
         self.rectangle = pygame.Rect(self.x, self.y, self.width, self.height)
         self.color = color
 
-    def manage_hovering(self, event):
-        if event.type == pygame.MOUSEMOTION or event.type == pygame.MOUSEBUTTONDOWN or event.type == pygame.MOUSEBUTTONUP :
-            x, y= event.pos
-            if (x >= self.x and x <= self.x+self.width) and (y >= self.y and y <= self.y+self.height):
-                self.hover = True
-            else :
-                self.hover = False
-
     def manage_set_mark(self, board):
-        self.mark = board.get_mark_at_position(self.position)
+        self.mark = board._get_mark_at_position_t(self.position)
         if self.mark == 2 : #which mensa it's an o
             self.O = True
         if self.mark == 1 : #which means it's an X
             self.X = True
-    def update(self, event, board):
+    def update(self, board):
         self.manage_set_mark(board)
-        self.manage_hovering(event)
+        #only redraw when the square actually changed since the last frame
+        new_state = (self.hover, self.X, self.O)
+        if new_state == self._last_state :
+            return None
+        self._last_state = new_state
         self.draw()
+        return self.rectangle
     def draw(self) :
         pygame.draw.rect(self.window, self.color, self.rectangle)
         if self.X:
-            cst = 1/15
-            hmarg = self.width/10
-            vmarg = self.height/10
-            length = self.width/8
-            #determining the coordinates of all the points of the X and draw it as a polygone
-            p1 = (self.x+hmarg, self.y+vmarg)
-            p2 = (self.x+hmarg+length, self.y+vmarg)
-            p3 = (self.x+self.width/2, self.y+self.height/2-self.height*cst)
-            p4 = (self.x+self.width-hmarg-length, self.y+vmarg)
-            p5 = (self.x+self.width-hmarg, self.y+vmarg)
-            p6 = (self.x+self.width/2+self.width*cst, self.y+self.height/2)
-            p7 = (self.x+self.width-hmarg, self.y+self.height-vmarg)
-            p8 = (self.x+self.width-hmarg-length, self.y+self.height-vmarg)
-            p9 = (self.x+self.width/2, self.y+self.height/2+self.height*cst)
-            p10 = (self.x+hmarg+length, self.y+self.height-vmarg)
-            p11 = (self.x+hmarg, self.y+self.height-vmarg)
-            p12 = (self.x+self.width/2-self.width*cst, self.y+self.height/2)
-            pygame.draw.polygon(window, (120,120,120),[p1 ,p2 ,p3 ,p4 ,p5 ,p6 ,p7 ,p8 ,p9 ,p10,p11,p12])
+            window.blit(self._x_surf, (self.x, self.y))
         if self.O :
-            outter_rect = pygame.Rect(self.x+self.width/10, self.y+self.height/10, self.width*8/10, self.height*8/10)
-            inner_rect = pygame.Rect(self.x+self.width/5, self.y+self.height/5, self.width*3/5, self.height*3/5)
-            pygame.draw.ellipse(window, (120,120,120),outter_rect)
-            pygame.draw.ellipse(window, self.color, inner_rect)
+            window.blit(self._o_surf, (self.x, self.y))
 #function to build the graphic of the board :
 def make_board(lines, cols):
+    """ build the squares as one flat list plus an O(1) pixel -> square lookup """
     board_squares = []
-    board_element = []
     for line in range(lines):
         for col in range(cols):
-            board_element.append(square((col,line), (cols,lines), window))
-        board_squares.append(board_element)
-        board_element = []
-    return(board_squares)
-#function to assign a mark to the hovered square of the board :
+            board_squares.append(square((line,col), (lines,cols), window))
+    square_width = 712/cols
+    square_height = 712/lines
+    def hit(pos):
+        col = int(pos[0] // square_width)
+        row = int(pos[1] // square_height)
+        if 0 <= col < cols and 0 <= row < lines :
+            return board_squares[row*cols + col]
+        return None
+    return board_squares, hit
+#function to assign a mark to the clicked square of the board :
 def make_mark (event: pygame.event):
-    if event.type == pygame.MOUSEBUTTONDOWN :
-        global board_squares, board
-        for sq in board_squares :
-            for sqare in sq:
-                if sqare.hover and board.get_mark_at_position(sqare.position) not in (1,2) and not board.has_won(X) and not board.has_won(O):
-                    board.push(sqare.position)
-                    click_sfx.play()
+    global board, game_status
+    sqare = square_hit(event.pos)
+    if sqare and game_status is None and board._is_empty_t(sqare.position):
+        board.push(sqare.position)
+        game_status = board.result()
+        click_sfx.play()
+#? event handlers dispatched by type, one dict lookup per event :
+def _on_quit (event):
+    global chosing_run
+    chosing_run = False
+def _on_click (event):
+    if not update :
+        make_mark(event)
+def _noop (event):
+    pass
+HANDLERS = {pygame.QUIT: _on_quit, pygame.MOUSEBUTTONDOWN: _on_click}
 board_squares = None
+square_hit = None
+hovered_square = None
 update = True
 chosing_run = True
 found = False
@@ -373,39 +656,45 @@ ok = False
 while chosing_run :
     events = pygame.event.get()
     for event in events :
-        if event.type == pygame.QUIT :
-            chosing_run = False
-        if not update:
-            make_mark(event)	
-        if board_squares :
-            for ss in board_squares :
-                for s in ss:
-                    s.update(event, board)
-                    s.draw()
-        if not update and board.has_won(X) :
-            window.blit(x_winner, ((712-x_winner.get_width())/2, 356-x_winner.get_height()))
-            ok = True
-        elif not update and board.has_won(O):
-            window.blit(o_winner, ((712-o_winner.get_width())/2, 356-o_winner.get_height()))
-            ok = True
-        elif not update and board.result() == 0 :
-            window.blit(draw, ((712-o_winner.get_width())/2, 356-o_winner.get_height()))
-            ok = True
+        HANDLERS.get(event.type, _noop)(event)
+    #render pass : once per frame, only the squares whose state changed
+    dirty_rects = []
+    if board_squares :
+        #hovering : one lookup of the square under the mouse, whatever the event rate
+        under_mouse = square_hit(pygame.mouse.get_pos())
+        if under_mouse is not hovered_square :
+            if hovered_square :
+                hovered_square.hover = False
+            if under_mouse :
+                under_mouse.hover = True
+            hovered_square = under_mouse
+        for s in board_squares :
+            dirty = s.update(board)
+            if dirty :
+                dirty_rects.append(dirty)
+    if not update and game_status == X :
+        dirty_rects.append(window.blit(x_winner, ((712-x_winner.get_width())/2, 356-x_winner.get_height())))
+        ok = True
+    elif not update and game_status == O:
+        dirty_rects.append(window.blit(o_winner, ((712-o_winner.get_width())/2, 356-o_winner.get_height())))
+        ok = True
+    elif not update and game_status == 0 :
+        dirty_rects.append(window.blit(draw, ((712-o_winner.get_width())/2, 356-o_winner.get_height())))
+        ok = True
     if update :
         window.fill((0,36,81))
-        window.blit(text_lines, (lines_widget.getX()-text_lines.get_width()/4, lines_widget.getY()+lines_widget.getHeight()))
-        window.blit(text_cols, (columns_widget.getX()-text_cols.get_width()/4, columns_widget.getY()+columns_widget.getHeight()))
-        window.blit(text_chain, (chain_widget.getX()-text_chain.get_width()/4, chain_widget.getY()+chain_widget.getHeight()))
-        window.blit(author1,(356-author1.get_width()/2, 556))
-        window.blit(author2,(356-author2.get_width()/2, 556+author2.get_height()))
-        pygame_widgets.update(events)
+        window.blit(static_overlay, (0,0))
     if ok :
         ok_button.setX(length/2-confirmation_button_size[0]/2)
         ok_button.setY(height-low_difference_of_th_button-confirmation_button_size[1])
-        pygame_widgets.update(events)
     else :
         ok_button.setY(-100)
         ok_button.setX(-100)
+    if update or ok :
+        pygame_widgets.update(events)
     clock.tick(FPS)
-    pygame.display.update()
+    if update or ok :
+        pygame.display.update()
+    else :
+        pygame.display.update(dirty_rects)
 pygame.quit()